@@ -0,0 +1,12 @@
+"""
+Process-wide IDXFinancialValidator shared by the debug scripts
+"""
+
+from functools import lru_cache
+
+from .idx_financial_validator import IDXFinancialValidator
+
+@lru_cache(maxsize=1)
+def get_shared_validator() -> IDXFinancialValidator:
+    """Return one validator per process so its Supabase client and reference data are reused"""
+    return IDXFinancialValidator()
@@ -89,7 +89,7 @@ class DataValidator:
     async def _fetch_table_data(self, table_name: str) -> pd.DataFrame:
         """Fetch data from Supabase table"""
         try:
-            response = self.supabase.table(table_name).select("*").execute()
+            response = await asyncio.to_thread(self.supabase.table(table_name).select("*").execute)
             return pd.DataFrame(response.data)
         except Exception as e:
             # Return empty DataFrame if table doesn't exist or error occurs
@@ -98,7 +98,7 @@ class DataValidator:
     async def _fetch_ticker_data(self, table_name: str, symbol: str) -> pd.DataFrame:
         """Fetch specific ticker data from Supabase table"""
         try:
-            response = self.supabase.table(table_name).select("*").eq("symbol", symbol).execute()
+            response = await asyncio.to_thread(self.supabase.table(table_name).select("*").eq("symbol", symbol).execute)
             return pd.DataFrame(response.data)
         except Exception as e:
             # Return empty DataFrame if table doesn't exist or error occurs
@@ -107,7 +107,7 @@ class DataValidator:
     async def _get_company_data(self, symbol: str) -> pd.DataFrame:
         """Fetch specific company data from Supabase table"""
         try:
-            response = self.supabase.table("idx_company_profile").select("*").eq("symbol", symbol).execute()
+            response = await asyncio.to_thread(self.supabase.table("idx_company_profile").select("*").eq("symbol", symbol).execute)
             return pd.DataFrame(response.data)
         except Exception as e:
             # Return empty DataFrame if table doesn't exist or error occurs
@@ -117,7 +117,7 @@ class DataValidator:
         """Get validation configuration for the table"""
         try:
             # Try to get from database first
-            response = self.supabase.table("validation_configs").select("*").eq("table_name", table_name).execute()
+            response = await asyncio.to_thread(self.supabase.table("validation_configs").select("*").eq("table_name", table_name).execute)
             
             if response.data:
                 row = response.data[0]
@@ -370,44 +370,50 @@ class DataValidator:
         print(f"Created validation JSON file: {filename}")
         return filepath
     
+    def _prepare_validation_data(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the validation_results row for a result, truncating oversized anomaly lists"""
+        # Prepare validation data
+        validation_data = {
+            "table_name": results["table_name"],
+            "status": results["status"],
+            "total_rows": results.get("total_rows", 0),
+            "anomalies_count": results["anomalies_count"],
+            "anomalies": results.get("anomalies", []).copy(),  # Make a copy
+            "validations_performed": results.get("validations_performed", []),
+            "validation_timestamp": results["validation_timestamp"]
+        }
+        
+        # Check anomalies data size
+        anomalies_size = len(json.dumps(validation_data["anomalies"]))
+        print(f"📊 Storing validation results: {validation_data['table_name']}")
+        print(f"   - Anomalies count: {validation_data['anomalies_count']}")
+        print(f"   - Anomalies data size: {anomalies_size} chars")
+        
+        # If anomalies data is too large (>50KB), truncate it for db only
+        if anomalies_size > 50000:
+            print(f"⚠️  Anomalies data too large ({anomalies_size} chars), truncating for database...")
+            original_count = len(validation_data["anomalies"])
+            # Keep only first 20 anomalies
+            validation_data["anomalies"] = validation_data["anomalies"][:20]
+            validation_data["anomalies"].append({
+                "type": "truncated_results",
+                "message": f"Results truncated - showing first 20 out of {original_count} anomalies",
+                "severity": "info"
+            })
+            print(f"   - Truncated to {len(json.dumps(validation_data['anomalies']))} chars")
+        
+        return validation_data
+    
     async def _store_validation_results(self, results: Dict[str, Any]) -> None:
         """Store validation results in database with timeout handling"""
         try:
-            # Prepare validation data
-            validation_data = {
-                "table_name": results["table_name"],
-                "status": results["status"],
-                "total_rows": results.get("total_rows", 0),
-                "anomalies_count": results["anomalies_count"],
-                "anomalies": results.get("anomalies", []).copy(),  # Make a copy
-                "validations_performed": results.get("validations_performed", []),
-                "validation_timestamp": results["validation_timestamp"]
-            }
-            
-            # Check anomalies data size
-            anomalies_size = len(json.dumps(validation_data["anomalies"]))
-            print(f"📊 Storing validation results: {validation_data['table_name']}")
-            print(f"   - Anomalies count: {validation_data['anomalies_count']}")
-            print(f"   - Anomalies data size: {anomalies_size} chars")
-            
-            # If anomalies data is too large (>50KB), truncate it for db only
-            if anomalies_size > 50000:
-                print(f"⚠️  Anomalies data too large ({anomalies_size} chars), truncating for database...")
-                original_count = len(validation_data["anomalies"])
-                # Keep only first 20 anomalies
-                validation_data["anomalies"] = validation_data["anomalies"][:20]
-                validation_data["anomalies"].append({
-                    "type": "truncated_results",
-                    "message": f"Results truncated - showing first 20 out of {original_count} anomalies",
-                    "severity": "info"
-                })
-                print(f"   - Truncated to {len(json.dumps(validation_data['anomalies']))} chars")
+            validation_data = self._prepare_validation_data(results)
             
             # Attempt insert with retry logic
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    response = self.supabase.table("validation_results").insert(validation_data).execute()
+                    response = await asyncio.to_thread(self.supabase.table("validation_results").insert(validation_data).execute)
                     print(f"âœ… Stored validation results for {results['table_name']} (attempt {attempt + 1})")
                     if response.data:
                         print(f"   - Inserted with ID: {response.data[0].get('id', 'unknown')}")
@@ -429,21 +435,24 @@ class DataValidator:
             except Exception as local_error:
                 print(f"⚠️  Local storage also failed: {local_error}")
                 
-            # Different error handling based on error type
-            if "timed out" in error_msg.lower():
-                print("💡 Database write timeout detected")
-                print("   - Try reducing anomaly data size")
-                print("   - Check database connection stability")
-            elif "relation" in error_msg.lower() and "does not exist" in error_msg.lower():
-                print("💡 validation_results table not found")
-                print("   - Create the table using SQL provided earlier")
-            elif "permission" in error_msg.lower() or "policy" in error_msg.lower():
-                print("💡 Database permission issue")
-                print("   - Check RLS policies and user permissions")
-            else:
-                print("💡 General database error - continuing without storing results")
+            self._print_storage_error_hints(error_msg)
             
             # Don't fail the validation process due to storage issues
+    
+    def _print_storage_error_hints(self, error_msg: str) -> None:
+        """Print a hint for a failed validation_results write based on the error type"""
+        if "timed out" in error_msg.lower():
+            print("💡 Database write timeout detected")
+            print("   - Try reducing anomaly data size")
+            print("   - Check database connection stability")
+        elif "relation" in error_msg.lower() and "does not exist" in error_msg.lower():
+            print("💡 validation_results table not found")
+            print("   - Create the table using SQL provided earlier")
+        elif "permission" in error_msg.lower() or "policy" in error_msg.lower():
+            print("💡 Database permission issue")
+            print("   - Check RLS policies and user permissions")
+        else:
+            print("💡 General database error - continuing without storing results")
             
     async def _store_results_locally(self, results: Dict[str, Any]) -> None:
         """Store validation results locally as fallback"""
@@ -5,12 +5,22 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import re
 import asyncio
+from itertools import chain
 import pytz
 import json
 
 from .data_validator import DataValidator
 from ..database.connection import get_supabase_client
 
+_NS_PER_DAY = 86_400 * 10**9
+_SUPABASE_PAGE_SIZE = 1000  # PostgREST default max rows per request
+_SUBSECTOR_SPLIT = re.compile(r'\s*,\s*')
+
+# Shareholder share_percentage totals (idx_company_profile)
+_PERCENTAGE_EXPECTED = 100.0
+_PERCENTAGE_TOLERANCE = 1.0  # 1% tolerance
+_PERCENTAGE_DECIMAL_THRESHOLD = 2.0  # totals at or below this are treated as 0-1 fractions
+
 class IDXFinancialValidator(DataValidator):
     """
     Specialized validator for IDX financial data tables
@@ -318,8 +328,10 @@ class IDXFinancialValidator(DataValidator):
                         print(f"⚠️  [Validator] Failed idx_agm query on {date_col}: {err}")
                         return []
 
-                rec_rows = _fetch_agm_by_date_column('recording_date')
-                agm_rows = _fetch_agm_by_date_column('agm_date')
+                rec_rows, agm_rows = await asyncio.gather(
+                    asyncio.to_thread(_fetch_agm_by_date_column, 'recording_date'),
+                    asyncio.to_thread(_fetch_agm_by_date_column, 'agm_date'),
+                )
 
                 # Merge and deduplicate rows
                 merged_rows: List[Dict[str, Any]] = []
@@ -343,33 +355,69 @@ class IDXFinancialValidator(DataValidator):
 
                 df = pd.DataFrame(merged_rows) if merged_rows else pd.DataFrame()
             else:
-                query = self.supabase.table(query_table).select("*")
+                # The completeness/coverage checks only read these columns; id keeps the paged order total
+                select_columns = {
+                    'idx_daily_data_completeness': 'id,date,symbol,close,volume,market_cap'
+                }.get(table_name, "*")
 
-                # If we have a target column and a start/end, apply inclusive filters
-                if date_filter_column and (start_date or end_date):
-                    try:
-                        start_val = start_date
-                        end_val = end_date
-                        if start_val:
-                            query = query.gte(date_filter_column, start_val)
-                        if end_val:
-                            query = query.lte(date_filter_column, end_val)
-                    except Exception as err:
-                        print(f"⚠️  [Validator] Failed to apply server-side date filters for {table_name}.{date_filter_column}: {err}")
+                def _build_query():
+                    query = self.supabase.table(query_table).select(select_columns)
 
-                # Limit to 600 rows with the newest timestamps for idx_filings
-                if query_table == 'idx_filings':
-                    query = query.order('timestamp', desc=True).limit(600)
+                    # If we have a target column and a start/end, apply inclusive filters
+                    if date_filter_column and (start_date or end_date):
+                        try:
+                            start_val = start_date
+                            end_val = end_date
+                            if start_val:
+                                query = query.gte(date_filter_column, start_val)
+                            if end_val:
+                                query = query.lte(date_filter_column, end_val)
+                        except Exception as err:
+                            print(f"⚠️  [Validator] Failed to apply server-side date filters for {table_name}.{date_filter_column}: {err}")
+
+                    # Limit to 600 rows with the newest timestamps for idx_filings
+                    if query_table == 'idx_filings':
+                        query = query.order('timestamp', desc=True).limit(600)
+                    return query
 
                 # Execute base query
+                raw_data = None
+                daily_df = None
                 try:
-                    response = query.execute()
-                    raw_data = getattr(response, 'data', None)
+                    if query_table == 'idx_daily_data':
+                        # A week of daily prices exceeds the per-request row cap, so page through it.
+                        # (date, symbol) can repeat, so id breaks ties and rows cannot move between pages
+                        frames = []
+                        offset = 0
+                        while True:
+                            response = await asyncio.to_thread(_build_query().order('date,symbol,id').range(offset, offset + _SUPABASE_PAGE_SIZE - 1).execute)
+                            page = getattr(response, 'data', None) or []
+                            if page:
+                                frames.append(pd.DataFrame(page))
+                            if len(page) < _SUPABASE_PAGE_SIZE:
+                                break
+                            offset += _SUPABASE_PAGE_SIZE
+                        daily_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+                        if not daily_df.empty:
+                            # Rows inserted between page requests can push a row onto the next page too
+                            if 'id' in daily_df.columns:
+                                daily_df = daily_df.drop_duplicates(subset='id', ignore_index=True)
+                            # Genuine repeats in the table are kept for the validator, only reported
+                            repeated = int(daily_df.duplicated(subset=['symbol', 'date']).sum())
+                            if repeated:
+                                print(f"⚠️  [Validator] idx_daily_data has {repeated} repeated (symbol, date) rows")
+                    else:
+                        response = await asyncio.to_thread(_build_query().execute)
+                        raw_data = getattr(response, 'data', None)
                     # print(f"🧪 [Validator] Raw response type={type(raw_data)} length={len(raw_data) if raw_data is not None else 'None'}")
                 except Exception as err:
                     print(f"❌ [Validator] Supabase query error for {query_table} (alias of {table_name}): {err}")
                     raw_data = None
-                df = pd.DataFrame(raw_data) if raw_data else pd.DataFrame()
+                    daily_df = None
+                if daily_df is not None:
+                    df = daily_df
+                else:
+                    df = pd.DataFrame(raw_data) if raw_data else pd.DataFrame()
 
             # Client-side top 50 by market cap only
             if table_name == 'sgx_company_report' and not df.empty:
@@ -1477,7 +1525,7 @@ class IDXFinancialValidator(DataValidator):
 
             # Fetch active symbols from idx_active_company_profile
             try:
-                resp = self.supabase.table('idx_active_company_profile').select('symbol').execute()
+                resp = await asyncio.to_thread(self.supabase.table('idx_active_company_profile').select('symbol').execute)
                 active_rows = getattr(resp, 'data', None) or []
                 active_df = pd.DataFrame(active_rows)
                 if 'symbol' not in active_df.columns or active_df.empty:
@@ -1850,8 +1898,8 @@ class IDXFinancialValidator(DataValidator):
             # data = data[~data['yield'].isna()]
             data['year'] = data['date'].dt.year
 
-            for symbol in data['symbol'].unique():
-                symbol_data = data[data['symbol'] == symbol]
+            # Partition rows by symbol in one pass
+            for symbol, symbol_data in data.groupby('symbol', sort=False, observed=True):
                 # data daily
                 try:
                     daily_data = await self._fetch_ticker_data('idx_daily_data', symbol)
@@ -2167,17 +2215,40 @@ class IDXFinancialValidator(DataValidator):
             data['timestamp'] = pd.to_datetime(data['timestamp'])
             data['date'] = data['timestamp'].dt.date
 
+            # Format the report date strings for the whole column
+            if pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+                data['date_str'] = data['timestamp'].dt.strftime('%Y-%m-%d')
+                data['timestamp_str'] = data['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+            else:
+                data['date_str'] = data['date'].astype(str)
+                data['timestamp_str'] = data['timestamp'].astype(str)
+
             # Rule 3: Transaction type consistency check
             # share_before > share_after -> must be "sell" (cannot be "buy")
             # share_before < share_after -> must be "buy" (cannot be "sell")
             type_check_cols = ['holding_before', 'holding_after', 'transaction_type']
             if all(col in data.columns for col in type_check_cols):
-                for idx, row in data.iterrows():
+                # Column arrays, indexed by row position in the loop below
+                row_index = data.index.to_numpy()
+                record_ids = data['id'].to_numpy() if 'id' in data.columns else row_index
+                symbols = data['symbol'].astype(str).to_numpy()
+                if 'holder_name' in data.columns:
+                    holder_names = data['holder_name'].fillna('N/A').astype(str).to_numpy()
+                else:
+                    holder_names = np.full(len(data), 'N/A', dtype=object)
+                transaction_types = data['transaction_type'].astype(str).str.strip().str.lower().to_numpy()
+
+                for idx, record_id, symbol, holder_name, holding_before, holding_after, transaction_type, filing_date in zip(
+                    row_index,
+                    record_ids,
+                    symbols,
+                    holder_names,
+                    data['holding_before'].to_numpy(),
+                    data['holding_after'].to_numpy(),
+                    transaction_types,
+                    data['date_str'].to_numpy(),
+                ):
                     try:
-                        holding_before = row.get('holding_before')
-                        holding_after = row.get('holding_after')
-                        transaction_type = str(row.get('transaction_type', '')).strip().lower()
-                        
                         # Skip if any value is missing
                         if pd.isna(holding_before) or pd.isna(holding_after) or not transaction_type:
                             continue
@@ -2186,44 +2257,35 @@ class IDXFinancialValidator(DataValidator):
                         holding_after = float(holding_after)
                         holding_diff = holding_after - holding_before
                         
-                        record_id = self._to_json_serializable(row.get('id', idx))
-                        symbol = str(row.get('symbol', 'N/A'))
-                        holder_name = str(row.get('holder_name', 'N/A'))
-                        filing_date = row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date'])
-                        
-                        # Check: if holdings decreased (sell), transaction_type cannot be "buy"
+                        # Holdings decreased (sell) cannot be "buy"; holdings increased (buy) cannot be "sell"
                         if holding_diff < 0 and transaction_type == 'buy':
-                            anomalies.append({
-                                "type": "transaction_type_mismatch",
-                                "record_id": record_id,
-                                "symbol": symbol,
-                                "holder_name": holder_name,
-                                "filing_date": filing_date,
-                                "holding_before": int(holding_before),
-                                "holding_after": int(holding_after),
-                                "holding_change": int(holding_diff),
-                                "reported_transaction_type": transaction_type,
-                                "expected_transaction_type": "sell",
-                                "message": f"Transaction type mismatch for {symbol} (ID: {record_id}): Holdings decreased by {abs(int(holding_diff)):,} shares ({int(holding_before):,} â†’ {int(holding_after):,}) but transaction_type is '{transaction_type}' instead of 'sell'",
-                                "severity": "flagged"
-                            })
-                        
-                        # Check: if holdings increased (buy), transaction_type cannot be "sell"
+                            expected_type = 'sell'
                         elif holding_diff > 0 and transaction_type == 'sell':
-                            anomalies.append({
-                                "type": "transaction_type_mismatch",
-                                "record_id": record_id,
-                                "symbol": symbol,
-                                "holder_name": holder_name,
-                                "filing_date": filing_date,
-                                "holding_before": int(holding_before),
-                                "holding_after": int(holding_after),
-                                "holding_change": int(holding_diff),
-                                "reported_transaction_type": transaction_type,
-                                "expected_transaction_type": "buy",
-                                "message": f"Transaction type mismatch for {symbol} (ID: {record_id}): Holdings increased by {int(holding_diff):,} shares ({int(holding_before):,} â†’ {int(holding_after):,}) but transaction_type is '{transaction_type}' instead of 'buy'",
-                                "severity": "flagged"
-                            })
+                            expected_type = 'buy'
+                        else:
+                            continue
+                        
+                        # Only build the report fields once a mismatch is confirmed
+                        record_id = self._to_json_serializable(record_id)
+                        before_int = int(holding_before)
+                        after_int = int(holding_after)
+                        change_int = int(holding_diff)
+                        direction = "decreased" if holding_diff < 0 else "increased"
+                        
+                        anomalies.append({
+                            "type": "transaction_type_mismatch",
+                            "record_id": record_id,
+                            "symbol": symbol,
+                            "holder_name": holder_name,
+                            "filing_date": filing_date,
+                            "holding_before": before_int,
+                            "holding_after": after_int,
+                            "holding_change": change_int,
+                            "reported_transaction_type": transaction_type,
+                            "expected_transaction_type": expected_type,
+                            "message": f"Transaction type mismatch for {symbol} (ID: {record_id}): Holdings {direction} by {abs(change_int):,} shares ({before_int:,} â†’ {after_int:,}) but transaction_type is '{transaction_type}' instead of '{expected_type}'",
+                            "severity": "flagged"
+                        })
                     except (ValueError, TypeError) as e:
                         print(f"âš ï¸  Error checking transaction type consistency for row {idx}: {e}")
                         continue
@@ -2242,17 +2304,24 @@ class IDXFinancialValidator(DataValidator):
                     (reconciliation_data['expected_holding_after'] != reconciliation_data['holding_after'])
                 ]
 
-                for _, row in mismatches.iterrows():
-                    record_id = self._to_json_serializable(row.get('id'))
-                    symbol = str(row.get('symbol', 'N/A'))
-                    net_shares = int(row['net_shares'])
-                    expected = int(row['expected_holding_after'])
-                    actual = int(row['holding_after'])
-
+                # tolist() yields native Python scalars, so the columns are JSON-ready
+                if 'id' in mismatches.columns:
+                    mismatch_ids = mismatches['id'].astype(object).where(mismatches['id'].notna(), None).tolist()
+                else:
+                    mismatch_ids = [None] * len(mismatches)
+
+                for record_id, symbol, holding_before, net_shares, expected, actual in zip(
+                    mismatch_ids,
+                    mismatches['symbol'].astype(str).tolist(),
+                    mismatches['holding_before'].astype('int64').tolist(),
+                    mismatches['net_shares'].astype('int64').tolist(),
+                    mismatches['expected_holding_after'].astype('int64').tolist(),
+                    mismatches['holding_after'].astype('int64').tolist(),
+                ):
                     anomalies.append({
                         "type": "holding_mismatch",
                         "symbol": symbol,
-                        "message": f"Holding mismatch for {symbol} (ID: {record_id}): holding_before {int(row['holding_before']):,} + net shares {net_shares:,} (from price_transaction) = expected holding_after {expected:,}, but recorded holding_after is {actual:,}",
+                        "message": f"Holding mismatch for {symbol} (ID: {record_id}): holding_before {holding_before:,} + net shares {net_shares:,} (from price_transaction) = expected holding_after {expected:,}, but recorded holding_after is {actual:,}",
                         "severity": "flagged"
                     })
 
@@ -2284,8 +2353,8 @@ class IDXFinancialValidator(DataValidator):
                     price_diff_pct = abs(filing_price - daily_close) / daily_close * 100
                     # print(f"Ticker {ticker} on {filing_date}: filing price {filing_price}, daily close {daily_close}, diff% {price_diff_pct:.2f}%")
                     if price_diff_pct >= 50.0:
-                        filing_date_str = filing_date.strftime('%Y-%m-%d') if hasattr(filing_date, 'strftime') else str(filing_date)
-                        filing_timestamp_str = filing['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if hasattr(filing['timestamp'], 'strftime') else str(filing['timestamp'])
+                        filing_date_str = filing['date_str']
+                        filing_timestamp_str = filing['timestamp_str']
                         
                         anomalies.append({
                             "type": "filing_price_discrepancy",
@@ -2322,7 +2391,7 @@ class IDXFinancialValidator(DataValidator):
             ]
             
             keys = composite_key + [
-                'id', 'created_at', 'source'
+                'id', 'created_at', 'source', 'date_str'
             ]
 
             df_duplicated = duplicates[keys]
@@ -2330,12 +2399,10 @@ class IDXFinancialValidator(DataValidator):
             for _, group in df_duplicated.groupby(composite_key):
                 symbol_display = str(group['symbol'].iloc[0])
 
-                date_id_labels = []
-
-                for _, row in group.iterrows():
-                    timestamp = row['timestamp']
-                    date_str = timestamp.strftime('%Y-%m-%d') if hasattr(timestamp, 'strftime') else str(timestamp)
-                    date_id_labels.append(f"{date_str} (ID: {row['id']})")
+                date_id_labels = [
+                    f"{date_str} (ID: {record_id})"
+                    for date_str, record_id in zip(group['date_str'].to_numpy(), group['id'].to_numpy())
+                ]
 
                 anomalies.append({
                     "type": "duplicate_transaction",
@@ -2372,38 +2439,34 @@ class IDXFinancialValidator(DataValidator):
                 })
                 return {"anomalies": anomalies}
 
-            data = data.copy()
-            data['date'] = pd.to_datetime(data['date'])
+            # Parse dates into a new frame, leaving the caller's data untouched
+            data = data.assign(date=pd.to_datetime(data['date'], errors='coerce'))
             
-            # Group by symbol and check for close splits
-            for symbol in data['symbol'].unique():
-                symbol_data = data[data['symbol'] == symbol].sort_values('date')
-                
+            # Group by symbol (single sort + partition) and check for close splits
+            for symbol, symbol_data in data.sort_values(['symbol', 'date']).groupby('symbol', sort=False):
                 if len(symbol_data) < 2:
                     continue  # Need at least 2 splits to compare
                 
-                # Check each pair of consecutive splits
-                for i in range(len(symbol_data) - 1):
+                # Days between consecutive splits, computed on int64 nanoseconds
+                dates = symbol_data['date'].to_numpy(dtype='datetime64[ns]')
+                day_diffs = np.diff(dates.view('i8')) // _NS_PER_DAY
+                has_dates = ~np.isnat(dates[:-1]) & ~np.isnat(dates[1:])
+                
+                # Check if within 2 weeks (14 days)
+                for i in np.flatnonzero(has_dates & (day_diffs <= 14)):
                     current_split = symbol_data.iloc[i]
                     next_split = symbol_data.iloc[i + 1]
-                    
-                    # Calculate time difference
-                    time_diff = next_split['date'] - current_split['date']
-                    days_diff = time_diff.days
-                    
-                    # Check if within 2 weeks (14 days)
-                    if days_diff <= 14:
-                        anomalies.append({
-                            "type": "close_stock_splits",
-                            "symbol": symbol,
-                            "first_split_date": current_split['date'].strftime('%Y-%m-%d'),
-                            "second_split_date": next_split['date'].strftime('%Y-%m-%d'),
-                            "days_between": days_diff,
-                            "first_split_ratio": float(current_split['split_ratio']),
-                            "second_split_ratio": float(next_split['split_ratio']),
-                            "message": f"Symbol {symbol}: Two stock splits occurred within a short timeframe",
-                            "severity": "info"
-                        })
+                    anomalies.append({
+                        "type": "close_stock_splits",
+                        "symbol": symbol,
+                        "first_split_date": current_split['date'].strftime('%Y-%m-%d'),
+                        "second_split_date": next_split['date'].strftime('%Y-%m-%d'),
+                        "days_between": int(day_diffs[i]),
+                        "first_split_ratio": float(current_split['split_ratio']),
+                        "second_split_ratio": float(next_split['split_ratio']),
+                        "message": f"Symbol {symbol}: Two stock splits occurred within a short timeframe",
+                        "severity": "info"
+                    })
         except Exception as e:
             anomalies.append({
                 "type": "validation_error",
@@ -2581,7 +2644,7 @@ class IDXFinancialValidator(DataValidator):
                         parsed_list = []
                     else:
                         if ',' in val:
-                            parsed_list = [p.strip() for p in val.split(',') if p.strip()]
+                            parsed_list = [p for p in _SUBSECTOR_SPLIT.split(val) if p]
                         else:
                             parsed_list = [val]
                 elif pd.isna(raw_val):
@@ -2643,125 +2706,166 @@ class IDXFinancialValidator(DataValidator):
         anomalies = []
         
         try:
-            # Convert DataFrame to list of dictionaries
+            # Only these columns are read; missing ones fall back to the same defaults as record.get()
+            field_defaults = {
+                'symbol': 'Unknown',
+                'financial_year': 'Unknown',
+                'income_stmt_metrics': {},
+                'industry_breakdown': {},
+            }
             if isinstance(data, pd.DataFrame):
-                data_list = data.to_dict('records')
+                columns = [
+                    data[col] if col in data.columns else [default] * len(data)
+                    for col, default in field_defaults.items()
+                ]
+                data_list = list(zip(*columns))
                 print(f"🏢 [SGX Manual Input Validator] Validating {len(data_list)} companies (top 50 by market cap)")
             else:
-                data_list = data  # Backward compatibility
+                # Backward compatibility
+                data_list = [
+                    tuple(record.get(col, default) for col, default in field_defaults.items())
+                    for record in data
+                ]
                 print(f"🏢 [SGX Manual Input Validator] Validating {len(data_list)} companies")
             
-            for record in data_list:
-                symbol = record.get('symbol', 'Unknown')
-                financial_year = record.get('financial_year', 'Unknown')
-                
-                # Get the reference total revenue
-                income_stmt = record.get('income_stmt_metrics', {})
-                total_revenue = income_stmt.get('total_revenue')
-                
-                if total_revenue is None:
-                    anomalies.append({
-                        "type": "missing_required_data",
-                        "symbol": symbol,
-                        "financial_year": financial_year,
-                        "message": f"Missing income_stmt_metrics.total_revenue for {symbol} ({financial_year})",
-                        "severity": "flagged"
-                    })
-                    continue
+            # Check the records in a worker thread so the event loop stays free
+            record_results = await asyncio.to_thread(list, (self._validate_sgx_manual_record(*fields) for fields in data_list))
+            anomalies.extend(chain.from_iterable(record_results))
+        except Exception as e:
+            anomalies.append({
+                "type": "validation_error",
+                "message": f"Error validating SGX manual input data: {str(e)}",
+                "severity": "flagged"
+            })
+            
+        return {"anomalies": anomalies}
+
+    def _validate_sgx_manual_record(self, symbol: Any, financial_year: Any, income_stmt: Dict[str, Any], industry_breakdown: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply the SGX manual input revenue rules to a single company record."""
+        anomalies = []
+
+        # A malformed record (e.g. NULL income_stmt_metrics) is reported without losing other results
+        try:
+            # Get the reference total revenue
+            total_revenue = income_stmt.get('total_revenue')
+        
+            if total_revenue is None:
+                anomalies.append({
+                    "type": "missing_required_data",
+                    "symbol": symbol,
+                    "financial_year": financial_year,
+                    "message": f"Missing income_stmt_metrics.total_revenue for {symbol} ({financial_year})",
+                    "severity": "flagged"
+                })
+                return anomalies
+        
+            # Validation Rule 1: customer_breakdown sum <= total_revenue
+            customer_breakdown = industry_breakdown.get('customer_breakdown', {})
+            if customer_breakdown:
+                try:
+                    customer_sum = 0.0
                 
-                industry_breakdown = record.get('industry_breakdown', {})
+                    # Handle different data types in customer_breakdown
+                    if isinstance(customer_breakdown, dict):
+                        scalar_values = []
+                        list_values = []
+                        for value in customer_breakdown.values():
+                            if isinstance(value, (int, float)):
+                                scalar_values.append(value)
+                            elif isinstance(value, list) and len(value) > 0:
+                                # Handle array format - sum all numeric values
+                                list_values.extend(item for item in value if isinstance(item, (int, float)))
+                        customer_sum = float(np.sum(scalar_values, dtype=float) + np.sum(list_values, dtype=float))
                 
-                # Validation Rule 1: customer_breakdown sum <= total_revenue
-                customer_breakdown = industry_breakdown.get('customer_breakdown', {})
-                if customer_breakdown:
-                    try:
-                        customer_sum = 0
+                    if customer_sum > total_revenue:
+                        # Only format the breakdown entries when we actually report them
                         customer_details = []
-                        
-                        # Handle different data types in customer_breakdown
-                        if isinstance(customer_breakdown, dict):
-                            for customer_type, value in customer_breakdown.items():
-                                if isinstance(value, (int, float)) and value is not None:
-                                    customer_sum += value
-                                    customer_details.append(f"{customer_type}: {value:,.0f}")
-                                elif isinstance(value, list) and len(value) > 0:
-                                    # Handle array format - sum all numeric values
-                                    for item in value:
-                                        if isinstance(item, (int, float)) and item is not None:
-                                            customer_sum += item
-                                    customer_details.append(f"{customer_type}: {value}")
-                        
-                        if customer_sum > total_revenue:
-                            anomalies.append({
-                                "type": "business_rule_violation",
-                                "symbol": symbol,
-                                "financial_year": financial_year,
-                                "metric": "customer_breakdown_sum",
-                                "message": f"Customer breakdown sum exceeds total revenue for {symbol} ({financial_year})",
-                                "customer_breakdown_sum": customer_sum,
-                                "total_revenue": total_revenue,
-                                "difference": customer_sum - total_revenue,
-                                "difference_pct": ((customer_sum - total_revenue) / total_revenue * 100) if total_revenue != 0 else 0,
-                                "customer_details": customer_details[:3],
-                                "severity": "flagged"
-                            })
-                    except Exception as e:
+                        for customer_type, value in customer_breakdown.items():
+                            if isinstance(value, (int, float)):
+                                customer_details.append(f"{customer_type}: {value:,.0f}")
+                            elif isinstance(value, list) and len(value) > 0:
+                                customer_details.append(f"{customer_type}: {value}")
+                            if len(customer_details) == 3:
+                                break
                         anomalies.append({
-                            "type": "validation_error",
+                            "type": "business_rule_violation",
                             "symbol": symbol,
                             "financial_year": financial_year,
-                            "message": f"Error processing customer_breakdown for {symbol} ({financial_year}): {str(e)}",
+                            "metric": "customer_breakdown_sum",
+                            "message": f"Customer breakdown sum exceeds total revenue for {symbol} ({financial_year})",
+                            "customer_breakdown_sum": customer_sum,
+                            "total_revenue": total_revenue,
+                            "difference": customer_sum - total_revenue,
+                            "difference_pct": ((customer_sum - total_revenue) / total_revenue * 100) if total_revenue != 0 else 0,
+                            "customer_details": customer_details,
                             "severity": "flagged"
                         })
+                except Exception as e:
+                    anomalies.append({
+                        "type": "validation_error",
+                        "symbol": symbol,
+                        "financial_year": financial_year,
+                        "message": f"Error processing customer_breakdown for {symbol} ({financial_year}): {str(e)}",
+                        "severity": "flagged"
+                    })
+        
+            # Validation Rule 2: property_counts_by_country sum(value1) <= total_revenue
+            property_counts = industry_breakdown.get('property_counts_by_country', {})
+            if property_counts:
+                try:
+                    # Sum value1 (index 1) from each [count, value1, value2] leaf
+                    property_sum = sum(
+                        property_data[1]
+                        for properties in property_counts.values() if isinstance(properties, dict)
+                        for property_data in properties.values()
+                        if isinstance(property_data, list) and len(property_data) >= 2
+                        and isinstance(property_data[1], (int, float))
+                    )
                 
-                # Validation Rule 2: property_counts_by_country sum(value1) <= total_revenue
-                property_counts = industry_breakdown.get('property_counts_by_country', {})
-                if property_counts:
-                    try:
-                        property_sum = 0
+                    if property_sum > total_revenue:
+                        # Only format the first few entries when we actually report them
                         property_details = []
-                        
                         for country, properties in property_counts.items():
-                            if isinstance(properties, dict):
-                                for property_type, property_data in properties.items():
-                                    if isinstance(property_data, list) and len(property_data) >= 2:
-                                        # Extract value1 (index 1) from [count, value1, value2]
-                                        value1 = property_data[1]
-                                        if isinstance(value1, (int, float)) and value1 is not None:
-                                            property_sum += value1
-                                            property_details.append(f"{country}-{property_type}: {value1:,.0f}")
-                        
-                        if property_sum > total_revenue:
-                            anomalies.append({
-                                "type": "business_rule_violation", 
-                                "symbol": symbol,
-                                "financial_year": financial_year,
-                                "metric": "property_counts_sum",
-                                "message": f"Property counts sum exceeds total revenue for {symbol} ({financial_year})",
-                                "property_counts_sum": property_sum,
-                                "total_revenue": total_revenue,
-                                "difference": property_sum - total_revenue,
-                                "difference_pct": ((property_sum - total_revenue) / total_revenue * 100) if total_revenue != 0 else 0,
-                                "property_details": property_details[:3],
-                                "severity": "flagged"
-                            })
-                    except Exception as e:
+                            if len(property_details) == 3:
+                                break
+                            if not isinstance(properties, dict):
+                                continue
+                            for property_type, property_data in properties.items():
+                                if isinstance(property_data, list) and len(property_data) >= 2 and isinstance(property_data[1], (int, float)):
+                                    property_details.append(f"{country}-{property_type}: {property_data[1]:,.0f}")
+                                    if len(property_details) == 3:
+                                        break
                         anomalies.append({
-                            "type": "validation_error",
+                            "type": "business_rule_violation", 
                             "symbol": symbol,
                             "financial_year": financial_year,
-                            "message": f"Error processing property_counts_by_country for {symbol} ({financial_year}): {str(e)}",
+                            "metric": "property_counts_sum",
+                            "message": f"Property counts sum exceeds total revenue for {symbol} ({financial_year})",
+                            "property_counts_sum": property_sum,
+                            "total_revenue": total_revenue,
+                            "difference": property_sum - total_revenue,
+                            "difference_pct": ((property_sum - total_revenue) / total_revenue * 100) if total_revenue != 0 else 0,
+                            "property_details": property_details,
                             "severity": "flagged"
                         })
-                        
+                except Exception as e:
+                    anomalies.append({
+                        "type": "validation_error",
+                        "symbol": symbol,
+                        "financial_year": financial_year,
+                        "message": f"Error processing property_counts_by_country for {symbol} ({financial_year}): {str(e)}",
+                        "severity": "flagged"
+                    })
         except Exception as e:
             anomalies.append({
                 "type": "validation_error",
-                "message": f"Error validating SGX manual input data: {str(e)}",
+                "symbol": symbol,
+                "financial_year": financial_year,
+                "message": f"Error validating SGX manual input for {symbol} ({financial_year}): {str(e)}",
                 "severity": "flagged"
             })
-            
-        return {"anomalies": anomalies}
+
+        return anomalies
 
     async def _validate_company_profile(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -2787,12 +2891,14 @@ class IDXFinancialValidator(DataValidator):
             # Load IDXIC reference for sector/industry validation
             idxic_ref = self._load_idxic_reference()
 
-            for idx, row in data.iterrows():
-                symbol = row.get('symbol')
+            # Iterate plain tuples over only the columns we read; optional IDXIC
+            # columns that are absent come back as NaN and are skipped below.
+            profile_cols = ['symbol', 'sector', 'industry', 'sub_industry', 'shareholders']
+            profile_rows = data.reindex(columns=profile_cols).itertuples(index=False, name=None)
 
+            for symbol, sector, industry, sub_industry, shareholders in profile_rows:
                 # ===== IDXIC Validation =====
                 # Check sector column against IDXIC reference
-                sector = row.get('sector')
                 if sector and isinstance(sector, str) and sector.strip():
                     sector_lower = sector.strip().lower()
                     if sector_lower not in idxic_ref['sectors']:
@@ -2806,7 +2912,6 @@ class IDXFinancialValidator(DataValidator):
                         })
 
                 # Check industry column against IDXIC reference
-                industry = row.get('industry')
                 if industry and isinstance(industry, str) and industry.strip():
                     industry_lower = industry.strip().lower()
                     if industry_lower not in idxic_ref['industries']:
@@ -2820,7 +2925,6 @@ class IDXFinancialValidator(DataValidator):
                         })
 
                 # Check sub_industry column against IDXIC reference
-                sub_industry = row.get('sub_industry')
                 if sub_industry and isinstance(sub_industry, str) and sub_industry.strip():
                     sub_industry_lower = sub_industry.strip().lower()
 
@@ -2851,7 +2955,6 @@ class IDXFinancialValidator(DataValidator):
 
                 # ===== Shareholders Validation =====
                 # Validate shareholders
-                shareholders = row.get('shareholders')
                 if shareholders is None or (isinstance(shareholders, float) and pd.isna(shareholders)):
                     anomalies.append({
                         "type": "missing_shareholders",
@@ -2924,14 +3027,12 @@ class IDXFinancialValidator(DataValidator):
                 
                 # Check if total percentage is approximately 100% (with 1% tolerance)
                 # Convert to percentage if values are in decimal (0-1 range)
-                if total_percentage <= 2.0:
+                if total_percentage <= _PERCENTAGE_DECIMAL_THRESHOLD:
                     total_percentage *= 100
                 
-                tolerance = 1.0  # 1% tolerance
-                expected = 100.0
-                difference = abs(total_percentage - expected)
+                difference = abs(total_percentage - _PERCENTAGE_EXPECTED)
                 
-                if difference > tolerance:
+                if difference > _PERCENTAGE_TOLERANCE:
                     anomalies.append({
                         "type": "shareholders_percentage_mismatch",
                         "symbol": symbol,
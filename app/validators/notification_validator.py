@@ -4,14 +4,46 @@ Data validator with email notification integration
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from .data_validator import DataValidator
 from ..notifications.email_helper import email_helper, notify_validation_result, should_notify
+from ..notifications.validation_email_service import validation_email_service
 
 logger = logging.getLogger(__name__)
 
+# Rows per insert request when flushing buffered validation_results
+RESULTS_INSERT_BATCH_SIZE = 1000
+
+# Seconds the configured table list from validation_configs is reused
+CONFIGURED_TABLES_TTL = 300
+
+def _now_iso() -> str:
+    """UTC timestamp in the ISO format used across validation results"""
+    return datetime.utcnow().isoformat()
+
+def _dedupe_table_names(table_names: List[str]) -> List[str]:
+    """Drop repeated table names, keeping first-seen order"""
+    unique_names = list(dict.fromkeys(table_names))
+    if len(unique_names) != len(table_names):
+        logger.warning(f"Dropped {len(table_names) - len(unique_names)} duplicate table names")
+    return unique_names
+
+class _ValidationBatch:
+    """validation_results rows and notification tasks collected by one validate_multiple_tables call"""
+    def __init__(self):
+        self.rows: List[Dict[str, Any]] = []
+        self.notifications: List[Tuple[str, asyncio.Task]] = []
+
+# Batch of the validate_multiple_tables call the current task runs under, if any.
+# Tasks created inside the batch inherit it; other validate_table calls do not see it
+_current_batch: ContextVar[Optional[_ValidationBatch]] = ContextVar("_current_batch", default=None)
+
 class NotificationDataValidator(DataValidator):
     def __init__(self, enable_notifications: bool = True):
         super().__init__()
@@ -31,6 +63,15 @@ class NotificationDataValidator(DataValidator):
         # Run the original validation
         results = await super().validate_table(table_name)
         
+        # Clean results never qualify for auto notification (mirrors should_notify)
+        if (
+            send_notification is None
+            and not results.get("anomalies")
+            and str(results.get("status") or "").lower() not in ("failed", "flagged", "critical")
+        ):
+            logger.debug(f"No anomalies for {table_name}, skipping notification")
+            return results
+        
         # Determine if notification should be sent
         if send_notification is None:
             send_notification = self.enable_notifications and should_notify(results)
@@ -39,6 +80,13 @@ class NotificationDataValidator(DataValidator):
         
         # Send notification if needed
         if send_notification:
+            batch = _current_batch.get()
+            if batch is not None:
+                # Let SMTP overlap with the remaining tables' validation
+                batch.notifications.append(
+                    (table_name, asyncio.create_task(self._send_validation_notification(table_name, results)))
+                )
+                return results
             try:
                 await self._send_validation_notification(table_name, results)
             except Exception as e:
@@ -48,54 +96,84 @@ class NotificationDataValidator(DataValidator):
         return results
     
     async def validate_multiple_tables(self, table_names: List[str], 
-                                     send_notifications: bool = True) -> Dict[str, Any]:
+                                     send_notifications: bool = True,
+                                     concurrency: int = 5) -> Dict[str, Any]:
         """
         Validate multiple tables and optionally send summary
         
         Args:
             table_names: List of table names to validate
             send_notifications: Whether to send individual notifications
+            concurrency: Maximum number of tables validated at the same time
             
         Returns:
             Dict containing aggregated results
         """
-        all_results = []
+        table_names = _dedupe_table_names(table_names)
+        ts = _now_iso()
         summary = {
-            "validation_timestamp": datetime.utcnow().isoformat(),
+            "validation_timestamp": ts,
             "total_tables": len(table_names),
             "tables_with_issues": 0,
             "total_anomalies": 0,
             "results": {}
         }
+        semaphore = asyncio.Semaphore(concurrency)
         
-        for table_name in table_names:
-            try:
-                result = await self.validate_table(table_name, send_notifications)
-                all_results.append(result)
-                summary["results"][table_name] = result
-                
-                if result.get("anomalies_count", 0) > 0:
-                    summary["tables_with_issues"] += 1
-                    summary["total_anomalies"] += result.get("anomalies_count", 0)
-                    
-            except Exception as e:
-                logger.error(f"Error validating table {table_name}: {e}")
-                error_result = {
-                    "table_name": table_name,
-                    "status": "error",
-                    "error": str(e),
-                    "validation_timestamp": datetime.utcnow().isoformat(),
-                    "anomalies_count": 0,
-                    "anomalies": []
-                }
-                all_results.append(error_result)
-                summary["results"][table_name] = error_result
+        async def _validate_one(table_name: str):
+            async with semaphore:
+                try:
+                    return table_name, await self.validate_table(table_name, send_notifications)
+                except Exception as e:
+                    logger.error(f"Error validating table {table_name}: {e}")
+                    return table_name, {
+                        "table_name": table_name,
+                        "status": "error",
+                        "error": str(e),
+                        "validation_timestamp": ts,
+                        "anomalies_count": 0,
+                        "anomalies": []
+                    }
+        
+        # Supabase requests run in worker threads, so independent tables overlap their round-trips
+        batch = _ValidationBatch()
+        token = _current_batch.set(batch)
+        try:
+            if sys.version_info >= (3, 11):
+                # _validate_one never raises, so the group cannot cancel siblings
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_validate_one(table_name)) for table_name in table_names]
+                pairs = [task.result() for task in tasks]
+            else:
+                pairs = await asyncio.gather(*(_validate_one(table_name) for table_name in table_names))
+        finally:
+            _current_batch.reset(token)
+            # Runs on cancellation too, so buffered rows and started notifications are not dropped
+            await self._flush_pending_validation_results(batch)
+            await self._await_pending_notifications(batch)
+        
+        for table_name, result in pairs:
+            summary["results"][table_name] = result
+            
+            if result.get("anomalies_count", 0) > 0:
+                summary["tables_with_issues"] += 1
+                summary["total_anomalies"] += result.get("anomalies_count", 0)
         
         # Store aggregated results
         await self._store_batch_validation_results(summary)
         
         return summary
     
+    async def _await_pending_notifications(self, batch: _ValidationBatch) -> None:
+        """Wait for notifications started during the batch, logging failures"""
+        if not batch.notifications:
+            return
+        pending, batch.notifications = batch.notifications, []
+        outcomes = await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+        for (table_name, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to send notification for {table_name}: {outcome}")
+    
     async def _send_validation_notification(self, table_name: str, results: Dict[str, Any]):
         """Send email notification for validation results"""
         try:
@@ -114,6 +192,44 @@ class NotificationDataValidator(DataValidator):
             logger.error(f"Error sending validation notification for {table_name}: {e}")
             raise
     
+    async def _store_validation_results(self, results: Dict[str, Any]) -> None:
+        """Buffer the validation_results row during a batch, otherwise store it immediately"""
+        batch = _current_batch.get()
+        if batch is None:
+            await super()._store_validation_results(results)
+            return
+        
+        try:
+            batch.rows.append(self._prepare_validation_data(results))
+        except Exception as e:
+            logger.error(f"Error preparing validation results for {results.get('table_name')}: {e}")
+    
+    async def _flush_pending_validation_results(self, batch: _ValidationBatch):
+        """Insert the batch's buffered validation_results rows in as few requests as possible"""
+        rows, batch.rows = batch.rows, []
+        if not rows:
+            return
+        
+        # Same retry policy as a single-row insert in DataValidator._store_validation_results
+        max_retries = 3
+        for start in range(0, len(rows), RESULTS_INSERT_BATCH_SIZE):
+            chunk = rows[start:start + RESULTS_INSERT_BATCH_SIZE]
+            for attempt in range(max_retries):
+                try:
+                    await asyncio.to_thread(self.supabase.table("validation_results").insert(chunk).execute)
+                    logger.info(f"Stored validation results for {len(chunk)} tables (attempt {attempt + 1})")
+                    break
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        logger.warning(f"Insert attempt {attempt + 1} for {len(chunk)} validation results failed, retrying... ({e})")
+                        await asyncio.sleep(1)
+                        continue
+                    logger.error(f"Error storing validation results batch: {e}")
+                    self._print_storage_error_hints(str(e))
+                    # Fall back to local storage so results are not lost
+                    for row in chunk:
+                        await self._store_results_locally(row)
+    
     async def _store_batch_validation_results(self, summary: Dict[str, Any]):
         """Store batch validation results"""
         try:
@@ -126,7 +242,8 @@ class NotificationDataValidator(DataValidator):
                 "summary_data": summary
             }
             
-            self.supabase.table("validation_batch_results").insert(batch_data).execute()
+            # The supabase client is synchronous, so run the request off the event loop
+            await asyncio.to_thread(self.supabase.table("validation_batch_results").insert(batch_data).execute)
             logger.info(f"Stored batch validation results for {summary['total_tables']} tables")
             
         except Exception as e:
@@ -137,6 +254,8 @@ class DailyValidationRunner:
     
     def __init__(self):
         self.validator = NotificationDataValidator(enable_notifications=True)
+        # (fetched_at monotonic time, table names) from validation_configs
+        self._configured_tables_cache: Optional[Tuple[float, List[str]]] = None
         
     async def run_daily_validations(self, table_names: List[str] = None) -> Dict[str, Any]:
         """
@@ -151,6 +270,7 @@ class DailyValidationRunner:
         try:
             if table_names is None:
                 table_names = await self._get_configured_tables()
+            table_names = _dedupe_table_names(table_names)
             
             logger.info(f"Starting daily validation for {len(table_names)} tables")
             
@@ -171,40 +291,60 @@ class DailyValidationRunner:
             return {
                 "status": "error",
                 "error": str(e),
-                "validation_timestamp": datetime.utcnow().isoformat()
+                "validation_timestamp": _now_iso()
             }
     
     async def _get_configured_tables(self) -> List[str]:
-        """Get list of tables configured for validation"""
+        """Get list of tables configured for validation (cached for CONFIGURED_TABLES_TTL seconds)"""
+        if self._configured_tables_cache is not None:
+            fetched_at, cached_tables = self._configured_tables_cache
+            if time.monotonic() - fetched_at < CONFIGURED_TABLES_TTL:
+                return list(cached_tables)
+        
         try:
             # Get from validation_configs table or use default list
-            response = self.validator.supabase.table("validation_configs").select("table_name").execute()
+            response = await asyncio.to_thread(
+                self.validator.supabase.table("validation_configs").select("table_name").execute
+            )
             
             if response.data:
-                return [row["table_name"] for row in response.data]
+                tables = [row["table_name"] for row in response.data]
             else:
                 # Default tables if none configured
-                return [
+                tables = [
                     "idx_financials_annual",
                     "idx_financials_quarterly", 
                     "idx_company_profile",
                     "idx_daily_prices",
                     "idx_dividend_history"
                 ]
+            
+            self._configured_tables_cache = (time.monotonic(), tables)
+            return list(tables)
                 
         except Exception as e:
             logger.error(f"Error getting configured tables: {e}")
             return []
     
+    def clear_configured_tables_cache(self):
+        """Drop the cached configured table list"""
+        self._configured_tables_cache = None
+    
+    async def refresh_configured_tables(self) -> List[str]:
+        """Re-read the configured table list from validation_configs, bypassing the cache"""
+        self.clear_configured_tables_cache()
+        return await self._get_configured_tables()
+    
     async def _send_daily_summary(self, validation_summary: Dict[str, Any]):
         """Send daily summary email"""
         try:
-            # Transform data for email template
+            total_anomalies = validation_summary.get("total_anomalies", 0)
+            # Transform data for email template; a clean run has no issues to aggregate
             summary_data = {
                 "total_validations": validation_summary.get("total_tables", 0),
-                "total_anomalies": validation_summary.get("total_anomalies", 0),
+                "total_anomalies": total_anomalies,
                 "tables_validated": list(validation_summary.get("results", {}).keys()),
-                "top_issues": self._extract_top_issues(validation_summary),
+                "top_issues": self._extract_top_issues(validation_summary) if total_anomalies else [],
                 "validation_date": datetime.now().strftime('%Y-%m-%d')
             }
             
@@ -220,31 +360,27 @@ class DailyValidationRunner:
     
     def _extract_top_issues(self, validation_summary: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract top issues from validation summary for email"""
-        issue_counts = {}
+        issue_counts = Counter()
+        # Only the first three tables per issue type are reported, so keep just those
+        issue_tables: Dict[str, List[str]] = defaultdict(list)
         
         for table_name, results in validation_summary.get("results", {}).items():
-            for anomaly in results.get("anomalies", []):
-                issue_type = anomaly.get("type", "unknown")
-                if issue_type not in issue_counts:
-                    issue_counts[issue_type] = {
-                        "type": issue_type,
-                        "count": 0,
-                        "tables": set()
-                    }
-                issue_counts[issue_type]["count"] += 1
-                issue_counts[issue_type]["tables"].add(table_name)
+            issue_types = [anomaly.get("type", "unknown") for anomaly in results.get("anomalies", [])]
+            issue_counts.update(issue_types)
+            for issue_type in dict.fromkeys(issue_types):
+                sample_tables = issue_tables[issue_type]
+                if len(sample_tables) < 3:
+                    sample_tables.append(table_name)
         
-        # Convert to list and sort by count
-        top_issues = []
-        for issue_type, issue_data in issue_counts.items():
-            top_issues.append({
+        # most_common selects the top 10 without sorting every issue type
+        return [
+            {
                 "type": issue_type,
-                "count": issue_data["count"],
-                "table": ", ".join(list(issue_data["tables"])[:3])
-            })
-        
-        top_issues.sort(key=lambda x: x["count"], reverse=True)
-        return top_issues[:10]
+                "count": count,
+                "table": ", ".join(issue_tables[issue_type])
+            }
+            for issue_type, count in issue_counts.most_common(10)
+        ]
 
 # Convenience functions for external use
 async def validate_table_with_notification(table_name: str) -> Dict[str, Any]:
@@ -257,38 +393,43 @@ async def run_daily_validations(table_names: List[str] = None) -> Dict[str, Any]
     runner = DailyValidationRunner()
     return await runner.run_daily_validations(table_names)
 
+# Sample payload for test_notification_system; shared, so never mutated
+_TEST_RESULTS_TEMPLATE: Dict[str, Any] = {
+    "total_rows": 100,
+    "anomalies_count": 2,
+    "anomalies": [
+        {
+            "type": "null_values",
+            "message": "Null values detected in required field",
+            "severity": "medium",
+            "column": "price",
+            "count": 5
+        },
+        {
+            "type": "outlier_detection", 
+            "message": "Statistical outliers detected",
+            "severity": "low",
+            "column": "volume",
+            "count": 3
+        }
+    ],
+    "status": "warning",
+    "validations_performed": ["data_quality", "statistical"]
+}
+
 async def test_notification_system(table_name: str = "test_table", test_email: str = None) -> Dict[str, Any]:
     """Test the notification system with a sample validation"""
     try:
+        ts = _now_iso()
         # Create test validation results
         test_results = {
             "table_name": table_name,
-            "validation_timestamp": datetime.utcnow().isoformat(),
-            "total_rows": 100,
-            "anomalies_count": 2,
-            "anomalies": [
-                {
-                    "type": "null_values",
-                    "message": "Null values detected in required field",
-                    "severity": "medium",
-                    "column": "price",
-                    "count": 5
-                },
-                {
-                    "type": "outlier_detection", 
-                    "message": "Statistical outliers detected",
-                    "severity": "low",
-                    "column": "volume",
-                    "count": 3
-                }
-            ],
-            "status": "warning",
-            "validations_performed": ["data_quality", "statistical"]
+            "validation_timestamp": ts,
+            **_TEST_RESULTS_TEMPLATE,
         }
         
         # Send test notification
         if test_email:
-            from ..notifications.validation_email_service import validation_email_service
             success = await validation_email_service.send_validation_alert(
                 table_name=table_name,
                 validation_results=test_results,
@@ -303,7 +444,7 @@ async def test_notification_system(table_name: str = "test_table", test_email: s
         return {
             "success": success,
             "test_results": test_results,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": ts
         }
         
     except Exception as e:
@@ -311,5 +452,5 @@ async def test_notification_system(table_name: str = "test_table", test_email: s
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
\ No newline at end of file
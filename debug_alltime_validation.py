@@ -3,7 +3,6 @@ Script untuk debugging dan testing algoritma validasi all-time price data
 menggunakan data dummy_alltime.json
 """
 
-import json
 import pandas as pd
 import asyncio
 import sys
@@ -23,11 +22,8 @@ async def test_alltime_validation():
 
     try:
         with open(json_file_path, 'r') as f:
-            data = json.load(f)
-        print(f"Loaded {len(data)} records from dummy_alltime.json")
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+            df = pd.read_json(f, orient='records', convert_dates=['date'])
+        print(f"Loaded {len(df)} records from dummy_alltime.json")
         print(f"DataFrame shape: {df.shape}")
         print(f"Columns: {list(df.columns)}")
         print(f"\nData types:")
@@ -39,10 +35,10 @@ async def test_alltime_validation():
         # Check for missing values in key columns
         key_columns = ['symbol', 'type', 'date', 'price']
         print(f"\nMissing values in key columns:")
+        missing_counts = df[[col for col in key_columns if col in df.columns]].isna().sum()
         for col in key_columns:
-            if col in df.columns:
-                missing_count = df[col].isna().sum()
-                print(f"  {col}: {missing_count} missing values")
+            if col in missing_counts:
+                print(f"  {col}: {missing_counts[col]} missing values")
             else:
                 print(f"  {col}: COLUMN NOT FOUND")
 
@@ -50,7 +46,6 @@ async def test_alltime_validation():
         if 'symbol' in df.columns:
             print(f"\nUnique symbols: {df['symbol'].unique()}")
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
             print(f"Date range: {df['date'].min()} to {df['date'].max()}")
 
         # Test the validator
@@ -75,10 +70,11 @@ async def test_alltime_validation():
         # Show some statistics about the data
         print(f"\n=== Data Statistics ===")
         if 'price' in df.columns:
+            price_stats = df['price'].agg(['min', 'max', 'mean'])
             print(f"\nprice:")
-            print(f"  Min: {df['price'].min():,.0f}")
-            print(f"  Max: {df['price'].max():,.0f}")
-            print(f"  Mean: {df['price'].mean():,.0f}")
+            print(f"  Min: {price_stats['min']:,.0f}")
+            print(f"  Max: {price_stats['max']:,.0f}")
+            print(f"  Mean: {price_stats['mean']:,.0f}")
     except FileNotFoundError:
         print(f"Error: Could not find dummy_alltime.json file at {json_file_path}")
     except Exception as e:
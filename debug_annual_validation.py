@@ -3,7 +3,6 @@ Script untuk debugging dan testing algoritma validasi annual financial data
 dengan menggunakan data sampel BBCA
 """
 
-import json
 import pandas as pd
 import asyncio
 import sys
@@ -24,12 +23,8 @@ async def test_annual_validation():
     
     try:
         with open(json_file_path, 'r') as f:
-            data = json.load(f)
-        
-        print(f"Loaded {len(data)} records from dummy.json")
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+            df = pd.read_json(f, orient='records', convert_dates=['date'])
+        print(f"Loaded {len(df)} records from dummy.json")
         
         print(f"DataFrame shape: {df.shape}")
         print(f"Columns: {list(df.columns)}")
@@ -42,10 +37,10 @@ async def test_annual_validation():
         # Check for missing values in key columns
         key_columns = ['symbol', 'date', 'revenue', 'earnings', 'total_assets']
         print(f"\nMissing values in key columns:")
+        missing_counts = df[[col for col in key_columns if col in df.columns]].isna().sum()
         for col in key_columns:
-            if col in df.columns:
-                missing_count = df[col].isna().sum()
-                print(f"  {col}: {missing_count} missing values")
+            if col in missing_counts:
+                print(f"  {col}: {missing_counts[col]} missing values")
             else:
                 print(f"  {col}: COLUMN NOT FOUND")
         
@@ -54,7 +49,6 @@ async def test_annual_validation():
             print(f"\nUnique symbols: {df['symbol'].unique()}")
         
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
             print(f"Date range: {df['date'].min()} to {df['date'].max()}")
             df['year'] = df['date'].dt.year
             print(f"Years: {sorted(df['year'].unique())}")
@@ -88,19 +82,27 @@ async def test_annual_validation():
         numeric_columns = ['revenue', 'earnings', 'total_assets', 'total_equity', 'operating_pnl']
         available_numeric = [col for col in numeric_columns if col in df.columns]
         
+        # Stats for all numeric columns, reported per column below
+        stats = df[available_numeric].agg(['min', 'max', 'mean'])
+        if len(df) > 1:
+            pct_changes = df[available_numeric].pct_change() * 100
+            change_stats = pd.DataFrame({
+                'min': pct_changes.min(),
+                'max': pct_changes.max(),
+                'avg': pct_changes.abs().mean(),
+                'count': pct_changes.count()
+            })
         for col in available_numeric:
             if not df[col].isna().all():
                 print(f"\n{col}:")
-                print(f"  Min: {df[col].min():,.0f}")
-                print(f"  Max: {df[col].max():,.0f}")
-                print(f"  Mean: {df[col].mean():,.0f}")
+                print(f"  Min: {stats.at['min', col]:,.0f}")
+                print(f"  Max: {stats.at['max', col]:,.0f}")
+                print(f"  Mean: {stats.at['mean', col]:,.0f}")
                 
                 # Year-over-year changes
-                if len(df) > 1:
-                    pct_changes = df[col].pct_change() * 100
-                    valid_changes = pct_changes.dropna()
-                    if len(valid_changes) > 0:
-                        print(f"  YoY changes: min={valid_changes.min():.1f}%, max={valid_changes.max():.1f}%, avg={valid_changes.abs().mean():.1f}%")
+                if len(df) > 1 and change_stats.at[col, 'count'] > 0:
+                    col_changes = change_stats.loc[col]
+                    print(f"  YoY changes: min={col_changes['min']:.1f}%, max={col_changes['max']:.1f}%, avg={col_changes['avg']:.1f}%")
         
     except FileNotFoundError:
         print(f"Error: Could not find dummy.json file at {json_file_path}")
@@ -3,8 +3,6 @@ Script untuk debugging dan testing algoritma validasi dividend data
 menggunakan data dummy_dividend.json
 """
 
-import json
-import pandas as pd
 import asyncio
 import sys
 import os
@@ -12,37 +10,39 @@ import os
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.validators.idx_financial_validator import IDXFinancialValidator
-
-async def test_dividend_validation():
+async def test_dividend_validation(verbose: bool = False):
     """Test the dividend validation with sample data"""
+    # Imported here so `--help` does not pay for pandas and the validator stack
+    import numpy as np
+    import pandas as pd
+    from app.validators._shared import get_shared_validator
+
     print("=== Testing IDX Dividend Validation ===\n")
 
     # Load sample data
     json_file_path = os.path.join(os.path.dirname(__file__), 'app', 'validators', 'dummy_dividend.json')
 
     try:
+        # dividend and yield stay float64 so results match what production computes
         with open(json_file_path, 'r') as f:
-            data = json.load(f)
-        print(f"Loaded {len(data)} records from dummy_dividend.json")
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+            df = pd.read_json(f, orient='records', convert_dates=['date'], dtype={'symbol': 'category'})
+        print(f"Loaded {len(df)} records from dummy_dividend.json")
         print(f"DataFrame shape: {df.shape}")
         print(f"Columns: {list(df.columns)}")
-        print(f"\nData types:")
-        print(df.dtypes)
+        if verbose:
+            print(f"\nData types:")
+            print(df.dtypes)
 
-        print(f"\nSample data (first record):")
-        print(df.iloc[0].to_dict())
+            print(f"\nSample data (first record):")
+            print(df.iloc[0].to_dict())
 
         # Check for missing values in key columns
         key_columns = ['symbol', 'date', 'dividend', 'yield']
         print(f"\nMissing values in key columns:")
+        missing_counts = df[[col for col in key_columns if col in df.columns]].isna().sum()
         for col in key_columns:
-            if col in df.columns:
-                missing_count = df[col].isna().sum()
-                print(f"  {col}: {missing_count} missing values")
+            if col in missing_counts:
+                print(f"  {col}: {missing_counts[col]} missing values")
             else:
                 print(f"  {col}: COLUMN NOT FOUND")
 
@@ -50,64 +50,83 @@ async def test_dividend_validation():
         if 'symbol' in df.columns:
             print(f"\nUnique symbols: {df['symbol'].unique()}")
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
             print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-            df['year'] = df['date'].dt.year
-            print(f"Years: {sorted(df['year'].unique())}")
+            # Calendar year of each date via datetime64[Y] buckets
+            dates = df['date'].to_numpy()
+            missing_dates = np.isnat(dates)
+            years = (dates.astype('datetime64[Y]').astype(np.int64) + 1970).astype(np.int16)
+            df['year'] = pd.arrays.IntegerArray(years, missing_dates)
+            print(f"Years: {np.unique(years[~missing_dates]).tolist()}")
 
         # Test the validator
         print(f"\n=== Running Dividend Validation ===")
-        validator = IDXFinancialValidator()
+        validator = get_shared_validator()
         result = await validator._validate_dividend(df)
 
         print(f"\nValidation Results:")
         print(f"Number of anomalies found: {len(result['anomalies'])}")
         if result['anomalies']:
-            print(f"\nDetailed anomalies:")
+            # Collect the report lines and print them in one write
+            lines = ["\nDetailed anomalies:"]
             for i, anomaly in enumerate(result['anomalies'], 1):
-                print(f"\n{i}. {anomaly['type']}")
-                print(f"   Message: {anomaly['message']}")
-                print(f"   Severity: {anomaly['severity']}")
+                lines.append(f"\n{i}. {anomaly['type']}")
+                lines.append(f"   Message: {anomaly['message']}")
+                lines.append(f"   Severity: {anomaly['severity']}")
                 for key, value in anomaly.items():
                     if key not in ['type', 'message', 'severity']:
-                        print(f"   {key}: {value}")
+                        lines.append(f"   {key}: {value}")
+            print("\n".join(lines))
         else:
             print("No anomalies detected!")
 
         # Show yearly average yield and changes
         print(f"\n=== Yearly Average Yield & Changes ===")
-        for symbol in df['symbol'].unique():
-            symbol_data = df[df['symbol'] == symbol].copy()
-            # symbol_data = symbol_data[~symbol_data['yield'].isna()]
-            if symbol_data.empty:
+        # One grouped pass over all symbols; categorical codes keep first-seen symbol order
+        yield_data = df[['symbol', 'year', 'yield']].assign(
+            symbol=lambda x: pd.Categorical(x['symbol'], categories=pd.unique(x['symbol'].dropna().to_numpy()))
+        )
+        yearly_avg = yield_data.groupby(['symbol', 'year'], observed=True)['yield'].mean()
+        # year x symbol grid; unstack also yields NaN for absent pairs, so track which exist
+        wide = yearly_avg.unstack(level='symbol')
+        has_year = pd.Series(True, index=yearly_avg.index).unstack(level='symbol', fill_value=False)
+        for symbol in wide.columns:
+            mask = has_year[symbol].to_numpy(dtype=bool)
+            if not mask.any():
                 continue
-            yearly_avg = symbol_data.groupby('year')['yield'].mean()
+            years = wide.index[mask]
+            avgs = wide[symbol].to_numpy(dtype=np.float64)[mask]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes = np.abs(np.diff(avgs) / avgs[:-1])
             print(f"\nSymbol: {symbol}")
             print("Yearly average yield:")
-            for year, avg in yearly_avg.items():
+            for year, avg in zip(years, avgs):
                 print(f"  {year}: {avg*100:.2f}%")
-            yearly_avg_sorted = yearly_avg.sort_index()
-            yearly_avg_change = yearly_avg_sorted.pct_change().abs()
             print("Yearly average yield change (abs):")
-            for year, change in yearly_avg_change.items():
-                if not pd.isna(change):
+            for year, change in zip(years[1:], changes):
+                if not np.isnan(change):
                     print(f"  {year}: {change*100:.2f}%")
 
-        # Show some statistics about the data
-        print(f"\n=== Data Statistics ===")
-        numeric_columns = ['dividend', 'yield']
-        available_numeric = [col for col in numeric_columns if col in df.columns]
-        for col in available_numeric:
-            if not df[col].isna().all():
-                print(f"\n{col}:")
-                print(f"  Min: {df[col].min():,.4f}")
-                print(f"  Max: {df[col].max():,.4f}")
-                print(f"  Mean: {df[col].mean():,.4f}")
-                if len(df) > 1:
-                    pct_changes = df[col].pct_change(fill_method=None) * 100
-                    valid_changes = pct_changes.dropna()
-                    if len(valid_changes) > 0:
-                        print(f"  Changes: min={valid_changes.min():.2f}%, max={valid_changes.max():.2f}%, avg={valid_changes.abs().mean():.2f}%")
+        if verbose:
+            # Show some statistics about the data
+            print(f"\n=== Data Statistics ===")
+            numeric_columns = ['dividend', 'yield']
+            available_numeric = [col for col in numeric_columns if col in df.columns]
+            # Stats for all numeric columns, reported per column below
+            stats = df[available_numeric].agg(['min', 'max', 'mean'])
+            for col in available_numeric:
+                if not df[col].isna().all():
+                    print(f"\n{col}:")
+                    print(f"  Min: {stats.at['min', col]:,.4f}")
+                    print(f"  Max: {stats.at['max', col]:,.4f}")
+                    print(f"  Mean: {stats.at['mean', col]:,.4f}")
+                    if len(df) > 1:
+                        # Row-over-row % change on the raw buffer; NaN/inf steps are skipped
+                        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                        with np.errstate(divide='ignore', invalid='ignore'):
+                            pct_changes = np.subtract(values[1:], values[:-1]) / values[:-1] * 100.0
+                        valid_changes = pct_changes[np.isfinite(pct_changes)]
+                        if valid_changes.size > 0:
+                            print(f"  Changes: min={valid_changes.min():.2f}%, max={valid_changes.max():.2f}%, avg={np.abs(valid_changes).mean():.2f}%")
     except FileNotFoundError:
         print(f"Error: Could not find dummy_dividend.json file at {json_file_path}")
     except Exception as e:
@@ -116,4 +135,10 @@ async def test_dividend_validation():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_dividend_validation())
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Debug IDX dividend validation')
+    parser.add_argument('--verbose', action='store_true', help='Print dtypes, a sample record and data statistics')
+    args = parser.parse_args()
+
+    asyncio.run(test_dividend_validation(verbose=args.verbose))
@@ -1,5 +1,5 @@
 import pandas as pd
-from app.validators.idx_financial_validator import IDXFinancialValidator
+from app.validators._shared import get_shared_validator
 import asyncio
 
 # Load dummy filings data
@@ -8,7 +8,7 @@ with open(filings_path, 'r', encoding='utf-8') as f:
     filings_data = pd.read_json(f)
 
 async def main():
-    validator = IDXFinancialValidator()
+    validator = get_shared_validator()
     result = await validator._validate_filings(filings_data)
     print('Validation result for idx_filings:')
     for anomaly in result['anomalies']:
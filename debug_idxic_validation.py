@@ -23,7 +23,15 @@ load_dotenv()
 # Add the app directory to the path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from app.validators.idx_financial_validator import IDXFinancialValidator
+from app.validators._shared import get_shared_validator
+
+
+def split_idxic_anomalies(result):
+    """Partition anomalies into (IDXIC name mismatches, everything else) in one pass"""
+    idxic_anomalies, other_anomalies = [], []
+    for anomaly in result.get('anomalies', ()):
+        (idxic_anomalies if anomaly.get('type') == 'idxic_name_mismatch' else other_anomalies).append(anomaly)
+    return idxic_anomalies, other_anomalies
 
 
 async def test_idxic_validation():
@@ -32,7 +40,7 @@ async def test_idxic_validation():
     print("=" * 60)
     print()
 
-    validator = IDXFinancialValidator()
+    validator = get_shared_validator()
 
     # Test 1: Company Profile validation
     print("[TEST] idx_company_profile...")
@@ -41,8 +49,7 @@ async def test_idxic_validation():
         result = await validator.validate_table("idx_company_profile")
 
         # Filter IDXIC-related anomalies
-        idxic_anomalies = [a for a in result.get('anomalies', []) if a.get('type') == 'idxic_name_mismatch']
-        other_anomalies = [a for a in result.get('anomalies', []) if a.get('type') != 'idxic_name_mismatch']
+        idxic_anomalies, other_anomalies = split_idxic_anomalies(result)
 
         print(f"Status: {result.get('status')}")
         print(f"Total rows checked: {result.get('total_rows', 0)}")
@@ -50,13 +57,14 @@ async def test_idxic_validation():
         print(f"Other anomalies found: {len(other_anomalies)}")
 
         if idxic_anomalies:
-            print("\n[!] IDXIC Name Mismatches:")
+            lines = ["\n[!] IDXIC Name Mismatches:"]
             for i, anomaly in enumerate(idxic_anomalies[:10], 1):  # Show first 10
-                print(f"  {i}. Symbol: {anomaly.get('symbol')}")
-                print(f"     Field: {anomaly.get('field')}")
-                print(f"     Value: {anomaly.get('value')}")
-                print(f"     Message: {anomaly.get('message')}")
-                print()
+                lines.append(f"  {i}. Symbol: {anomaly.get('symbol')}")
+                lines.append(f"     Field: {anomaly.get('field')}")
+                lines.append(f"     Value: {anomaly.get('value')}")
+                lines.append(f"     Message: {anomaly.get('message')}")
+                lines.append("")
+            print("\n".join(lines))
 
             if len(idxic_anomalies) > 10:
                 print(f"  ... and {len(idxic_anomalies) - 10} more")
@@ -78,8 +86,7 @@ async def test_idxic_validation():
         result = await validator.validate_table("idx_sector_reports")
 
         # Filter IDXIC-related anomalies
-        idxic_anomalies = [a for a in result.get('anomalies', []) if a.get('type') == 'idxic_name_mismatch']
-        other_anomalies = [a for a in result.get('anomalies', []) if a.get('type') != 'idxic_name_mismatch']
+        idxic_anomalies, other_anomalies = split_idxic_anomalies(result)
 
         print(f"Status: {result.get('status')}")
         print(f"Total rows checked: {result.get('total_rows', 0)}")
@@ -87,14 +94,15 @@ async def test_idxic_validation():
         print(f"Other anomalies found: {len(other_anomalies)}")
 
         if idxic_anomalies:
-            print("\n[!] IDXIC Name Mismatches:")
+            lines = ["\n[!] IDXIC Name Mismatches:"]
             for i, anomaly in enumerate(idxic_anomalies[:10], 1):  # Show first 10
-                print(f"  {i}. Sector: {anomaly.get('sector')}")
-                print(f"     Sub-sector: {anomaly.get('sub_sector')}")
-                print(f"     Field: {anomaly.get('field')}")
-                print(f"     Value: {anomaly.get('value')}")
-                print(f"     Message: {anomaly.get('message')}")
-                print()
+                lines.append(f"  {i}. Sector: {anomaly.get('sector')}")
+                lines.append(f"     Sub-sector: {anomaly.get('sub_sector')}")
+                lines.append(f"     Field: {anomaly.get('field')}")
+                lines.append(f"     Value: {anomaly.get('value')}")
+                lines.append(f"     Message: {anomaly.get('message')}")
+                lines.append("")
+            print("\n".join(lines))
 
             if len(idxic_anomalies) > 10:
                 print(f"  ... and {len(idxic_anomalies) - 10} more")
@@ -1,5 +1,5 @@
 import pandas as pd
-from app.validators.idx_financial_validator import IDXFinancialValidator
+from app.validators._shared import get_shared_validator
 import asyncio
 
 # Load dummy stock split data
@@ -8,7 +8,7 @@ with open(stocksplit_path, 'r', encoding='utf-8') as f:
     stocksplit_data = pd.read_json(f)
 
 async def main():
-    validator = IDXFinancialValidator()
+    validator = get_shared_validator()
     result = await validator._validate_stock_split(stocksplit_data)
     print('Validation result for idx_stock_split:')
     for anomaly in result['anomalies']:
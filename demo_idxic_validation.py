@@ -6,41 +6,90 @@ import sys
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+import pickle
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+IDXIC_CSV_PATH = Path(__file__).parent / "idxic_name_202602050852.csv"
+# Built hierarchy map, reused while it is newer than the CSV
+IDXIC_HIERARCHY_CACHE_PATH = Path(__file__).parent / "idxic_hierarchy.pkl"
+
+@lru_cache(maxsize=1)
 def load_idxic_reference():
     """Load IDXIC reference with hierarchy mapping"""
-    csv_path = Path(__file__).parent / "idxic_name_202602050852.csv"
-    df = pd.read_csv(csv_path)
+    csv_path = IDXIC_CSV_PATH
+    pkl_path = IDXIC_HIERARCHY_CACHE_PATH
+    if pkl_path.exists() and pkl_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            with open(pkl_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Unreadable snapshot, rebuild from the CSV
+
+    df = pd.read_csv(
+        csv_path,
+        usecols=['code', 'name', 'classification'],
+        dtype={'code': 'string', 'classification': 'category'}
+    )
+
+    codes = df['code'].to_numpy()
+    names = df['name'].str.lower().str.strip().to_numpy()
+    classes = df['classification'].to_numpy()
 
     # Build code to name mapping
-    code_to_name = {}
-    for _, row in df.iterrows():
-        code_to_name[row['code']] = (row['name'].lower().strip(), row['classification'])
+    code_to_name = dict(zip(codes, zip(names, classes)))
 
     # Build hierarchy: sub_industry -> expected parent industry
     sub_industry_to_industry = {}
-    for _, row in df.iterrows():
-        if row['classification'] == 'Sub Industry':
-            sub_ind_code = row['code']
-            sub_ind_name = row['name'].lower().strip()
-            parent_code = sub_ind_code[:3]  # A111 -> A11
-            if parent_code in code_to_name:
-                parent_name, parent_class = code_to_name[parent_code]
-                if parent_class == 'Industry':
-                    sub_industry_to_industry[sub_ind_name] = parent_name
+    is_sub_industry = classes == 'Sub Industry'
+    for sub_ind_code, sub_ind_name in zip(codes[is_sub_industry], names[is_sub_industry]):
+        parent_code = sub_ind_code[:3]  # A111 -> A11
+        if parent_code in code_to_name:
+            parent_name, parent_class = code_to_name[parent_code]
+            if parent_class == 'Industry':
+                sub_industry_to_industry[sub_ind_name] = parent_name
+
+    try:
+        with open(pkl_path, 'wb') as f:
+            pickle.dump(sub_industry_to_industry, f)
+    except OSError:
+        pass  # Snapshot is only an optimization
 
     return sub_industry_to_industry
 
-def validate_company(symbol, industry, sub_industry, hierarchy_map):
-    """Validate a single company's industry/sub_industry"""
-    industry_lower = industry.lower().strip()
-    sub_industry_lower = sub_industry.lower().strip()
+def build_hierarchy_frame(hierarchy_map):
+    """Turn the sub_industry -> industry mapping into a join table"""
+    return pd.DataFrame(list(hierarchy_map.items()), columns=['sub_industry_key', 'expected_industry'])
+
+def validate_companies(companies, hierarchy_df):
+    """Return the companies whose sub_industry belongs to a different industry"""
+    sub_industry_key = companies['sub_industry'].str.lower().str.strip()
+    industry_key = companies['industry'].str.lower().str.strip()
+
+    # Integer-encode both columns against the reference; -1 marks values it does not know
+    industries = pd.Index(hierarchy_df['expected_industry'].unique())
+    sub_codes = pd.Categorical(sub_industry_key, categories=hierarchy_df['sub_industry_key']).codes
+    ind_codes = pd.Categorical(industry_key, categories=industries).codes
 
-    expected_parent = hierarchy_map.get(sub_industry_lower)
+    # sub_industry code -> expected industry code; the trailing -1 serves sub_codes == -1
+    expected_lut = np.append(industries.get_indexer(hierarchy_df['expected_industry']), -1).astype(np.int32)
+    expected_codes = expected_lut[sub_codes]
+
+    # Sub-industries missing from the reference are not flagged
+    mismatch = (expected_codes != -1) & (expected_codes != ind_codes)
+    return companies.loc[mismatch].assign(
+        expected_industry=industries.to_numpy()[expected_codes[mismatch]]
+    ).reset_index(drop=True)
+
+def validate_company(symbol, industry, sub_industry, hierarchy_df):
+    """Validate a single company's industry/sub_industry"""
+    company = pd.DataFrame([{"symbol": symbol, "industry": industry, "sub_industry": sub_industry}])
+    mismatches = validate_companies(company, hierarchy_df)
 
-    if expected_parent and expected_parent != industry_lower:
+    if not mismatches.empty:
+        expected_parent = mismatches.at[0, 'expected_industry']
         return {
             "status": "MISMATCH",
             "type": "idxic_hierarchy_mismatch",
@@ -66,6 +115,7 @@ def main():
 
     # Load hierarchy mapping
     hierarchy_map = load_idxic_reference()
+    hierarchy_df = build_hierarchy_frame(hierarchy_map)
     print(f"[INFO] Loaded {len(hierarchy_map)} sub_industry -> industry mappings")
     print()
 
@@ -94,7 +144,7 @@ def main():
         "EDGE.JK",
         "IT Services & Consulting",
         "IT Services & Consulting",
-        hierarchy_map)
+        hierarchy_df)
     print(f"  Industry: IT Services & Consulting")
     print(f"  Sub-industry: IT Services & Consulting")
     print(f"  Result: {result['status']}")
@@ -109,7 +159,7 @@ def main():
         "EDGE.JK",
         "Online Applications & Services",  # WRONG!
         "IT Services & Consulting",
-        hierarchy_map)
+        hierarchy_df)
     print(f"  Industry: Online Applications & Services")
     print(f"  Sub-industry: IT Services & Consulting")
     print(f"  Result: {result['status']}")
@@ -124,7 +174,7 @@ def main():
         "TEST.JK",
         "Insurance",  # WRONG - Banks sub_industry should have Banks industry
         "Banks",
-        hierarchy_map)
+        hierarchy_df)
     print(f"  Industry: Insurance")
     print(f"  Sub-industry: Banks")
     print(f"  Result: {result['status']}")
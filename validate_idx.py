@@ -2,7 +2,7 @@ import asyncio
 import sys
 import os
 from datetime import datetime
-import json
+import orjson
 
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
@@ -12,6 +12,9 @@ from app.notifications.validation_email_service import ValidationEmailService
 from app.notifications.email_helper import EmailHelper
 from app.database.connection import get_supabase_client, init_database
 
+# Tables validated at the same time; keeps Supabase request bursts under its rate limits
+MAX_CONCURRENT_VALIDATIONS = 4
+
 async def validate_single_table(table_name: str, send_email: bool = True):
     """Validate a single IDX table"""
     print(f"\n🔍 Validating table: {table_name}")
@@ -78,8 +81,22 @@ async def validate_all_idx_tables(send_email: bool = True):
     results = {}
     total_anomalies = 0
     
-    for table_name in idx_tables:
-        result = await validate_single_table(table_name, send_email)
+    # Supabase fetches run in worker threads, so the tables' round-trips overlap
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+    
+    async def _validate_bounded(table_name: str):
+        async with semaphore:
+            return await validate_single_table(table_name, send_email)
+    
+    table_results = await asyncio.gather(
+        *(_validate_bounded(table_name) for table_name in idx_tables),
+        return_exceptions=True
+    )
+    
+    for table_name, result in zip(idx_tables, table_results):
+        if isinstance(result, BaseException):
+            print(f"❌ Error validating {table_name}: {result}")
+            continue
         if result:
             results[table_name] = result
             total_anomalies += result.get('anomalies_count', 0)
@@ -97,13 +114,14 @@ async def validate_all_idx_tables(send_email: bool = True):
     # Save results to file
     summary_file = f"validation_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     try:
-        with open(summary_file, 'w') as f:
-            json.dump({
+        # orjson serializes numpy values and datetimes natively; str() covers anything else
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps({
                 'timestamp': datetime.now().isoformat(),
                 'total_tables': len(results),
                 'total_anomalies': total_anomalies,
                 'results': results
-            }, f, indent=2, default=str)
+            }, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
         print(f"📄 Results saved to: {summary_file}")
     except Exception as e:
         print(f"❌ Failed to save results: {e}")
@@ -150,8 +168,14 @@ async def main():
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard] on Linux/macOS; fall back to the default loop elsewhere
+    try:
+        from uvloop import run as run_event_loop
+    except ImportError:
+        run_event_loop = asyncio.run
+
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\n🛑 Validation interrupted by user")
         sys.exit(1)